@@ -8,23 +8,52 @@ Author: Justin Liverman (d3f4ult) - Mezzanine DAO
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 import json
-from scipy import stats
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; fall back to the interpreted path
+    NUMBA_AVAILABLE = False
+    prange = range
 
-@dataclass
+    def njit(*args, **kwargs):
+        """No-op decorator stand-in when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Record layout for individual order fills (one np.rec array per time step)
+FILL_DTYPE = np.dtype([
+    ('time', 'i4'),
+    ('trigger_buy', 'f8'),
+    ('sell_amount', 'f8'),
+    ('tokens_sold', 'f8'),
+    ('quote_received', 'f8'),
+    ('price_at_fill', 'f8'),
+])
+
+
+@dataclass(slots=True)
 class AMMPool:
     """Constant Product Market Maker (x * y = k)"""
     token_reserve: float  # x - token amount (e.g., $DFLT)
     quote_reserve: float  # y - quote amount (e.g., SOL)
-    
+    _k: float = field(init=False, repr=False)  # Cached invariant
+
+    def __post_init__(self):
+        self._k = self.token_reserve * self.quote_reserve
+
     @property
     def k(self) -> float:
-        """Invariant constant"""
-        return self.token_reserve * self.quote_reserve
+        """Invariant constant (cached; swaps preserve it analytically)"""
+        return self._k
     
     @property
     def price(self) -> float:
@@ -45,7 +74,7 @@ class AMMPool:
             return 0
         
         new_quote = self.quote_reserve + quote_amount
-        new_token = self.k / new_quote
+        new_token = self._k / new_quote
         tokens_out = self.token_reserve - new_token
         
         self.quote_reserve = new_quote
@@ -62,7 +91,7 @@ class AMMPool:
             return 0
         
         new_token = self.token_reserve + token_amount
-        new_quote = self.k / new_token
+        new_quote = self._k / new_token
         quote_out = self.quote_reserve - new_quote
         
         self.token_reserve = new_token
@@ -83,19 +112,32 @@ class AMMPool:
         return AMMPool(self.token_reserve, self.quote_reserve)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfitMaxiOrder:
     """Volume-Sensitive Limit Order"""
     total_size: float          # Total order size in quote currency
     delta_ratio: float         # r ∈ (0, 1] - matching ratio
     min_threshold: float       # θ - minimum buy size to trigger
     remaining: float = None    # Remaining unfilled amount
-    fills: List[dict] = field(default_factory=list)
-    
+    fills: np.recarray = None  # Preallocated FILL_DTYPE buffer
+    num_fills: int = 0         # Write cursor into fills
+
     def __post_init__(self):
         if self.remaining is None:
             self.remaining = self.total_size
-    
+        if self.fills is None:
+            self.fills = np.recarray(64, dtype=FILL_DTYPE)
+
+    def record_fills(self, records: np.recarray) -> None:
+        """Append a batch of fill records, growing the buffer geometrically"""
+        end = self.num_fills + len(records)
+        if end > len(self.fills):
+            grown = np.recarray(max(2 * len(self.fills), end), dtype=FILL_DTYPE)
+            grown[:self.num_fills] = self.fills[:self.num_fills]
+            self.fills = grown
+        self.fills[self.num_fills:end] = records
+        self.num_fills = end
+
     @property
     def filled(self) -> float:
         return self.total_size - self.remaining
@@ -134,25 +176,163 @@ class SimulationConfig:
     organic_sell_rate: float = 0              # Additional sell pressure
     mean_organic_sell: float = 1.0
 
+    # Reproducibility: seeds every RNG stream when set
+    seed: Optional[int] = None
 
-@dataclass 
+
+@dataclass(slots=True)
 class SimulationResult:
-    """Results from a single simulation run"""
+    """Results from a single simulation run (pure data, precomputed)"""
     final_price: float
     initial_price: float
     fill_time: int
     total_volume: float
-    price_history: List[float]
-    fill_history: List[float]
-    order_fills: List[dict]
-    
-    @property
-    def price_change_pct(self) -> float:
-        return ((self.final_price - self.initial_price) / self.initial_price) * 100
-    
-    @property
-    def was_filled(self) -> bool:
-        return self.fill_history[-1] >= 99.99  # Account for floating point
+    price_history: np.ndarray
+    fill_history: np.ndarray
+    order_fills: np.recarray  # FILL_DTYPE records, one row per fill
+    price_change_pct: float
+    was_filled: bool  # fill >= 99.99% to account for floating point
+
+
+@njit(cache=True, fastmath=True)
+def _sim_core(token_reserve, quote_reserve, order_size, delta_ratio,
+              min_threshold, buy_rate, log_mean_buy, buy_sigma,
+              organic_rate, mean_organic_sell, max_time_steps, seed,
+              record_trajectory):
+    """
+    Jitted single-simulation core: pure scalar AMM math, no class
+    attribute access, so Numba lowers the whole time loop to native code.
+
+    Returns (price_hist, fill_hist, fills, fill_time, total_volume,
+    final_price, fill_rate) where fills is a (n_fills, 6) array of
+    FILL_DTYPE columns. With record_trajectory=False the history arrays
+    stay length 1 and the loop runs register-resident; the summary
+    scalars are always returned.
+    """
+    np.random.seed(seed)
+
+    hist_len = max_time_steps + 1 if record_trajectory else 1
+    price_hist = np.empty(hist_len)
+    fill_hist = np.empty(hist_len)
+    fills = np.empty((64, 6))
+    n_fills = 0
+
+    tok = token_reserve
+    quote = quote_reserve
+    remaining = order_size
+    total_volume = 0.0
+
+    price_hist[0] = quote / tok
+    fill_hist[0] = 0.0
+    steps = 0
+
+    for t in range(max_time_steps):
+        if remaining <= 0:
+            break
+
+        num_buys = np.random.poisson(buy_rate)
+        for _ in range(num_buys):
+            buy_size = np.random.lognormal(log_mean_buy, buy_sigma)
+            if buy_size < 0.01:
+                buy_size = 0.01
+            total_volume += buy_size
+
+            # Execute the buy (constant-k swap)
+            k = tok * quote
+            quote = quote + buy_size
+            tok = k / quote
+
+            # Check if triggers ProfitMaxi
+            if buy_size >= min_threshold and remaining > 0:
+                sell_quote = delta_ratio * buy_size
+                if sell_quote > remaining:
+                    sell_quote = remaining
+
+                price = quote / tok
+                tokens_to_sell = sell_quote / price
+
+                # Execute the sell
+                k = tok * quote
+                tok = tok + tokens_to_sell
+                new_quote = k / tok
+                quote_received = quote - new_quote
+                quote = new_quote
+
+                remaining -= sell_quote
+
+                if n_fills == fills.shape[0]:
+                    grown = np.empty((fills.shape[0] * 2, 6))
+                    grown[:n_fills] = fills[:n_fills]
+                    fills = grown
+                fills[n_fills, 0] = t
+                fills[n_fills, 1] = buy_size
+                fills[n_fills, 2] = sell_quote
+                fills[n_fills, 3] = tokens_to_sell
+                fills[n_fills, 4] = quote_received
+                fills[n_fills, 5] = quote / tok
+                n_fills += 1
+
+        # Optional: organic sell pressure
+        if organic_rate > 0:
+            num_organic_sells = np.random.poisson(organic_rate)
+            for _ in range(num_organic_sells):
+                organic_sell = np.random.exponential(mean_organic_sell)
+                price = quote / tok
+                k = tok * quote
+                tok = tok + organic_sell / price
+                quote = k / tok
+
+        if record_trajectory:
+            price_hist[t + 1] = quote / tok
+            fill_hist[t + 1] = (order_size - remaining) / order_size * 100.0
+        steps = t + 1
+
+    return (price_hist[:steps + 1], fill_hist[:steps + 1],
+            fills[:n_fills], steps, total_volume,
+            quote / tok, (order_size - remaining) / order_size * 100.0)
+
+
+@njit(parallel=True, cache=True)
+def _sim_core_batch(n_sims, token_reserve, quote_reserve, order_size,
+                    delta_ratio, min_threshold, buy_rate, log_mean_buy,
+                    buy_sigma, organic_rate, mean_organic_sell,
+                    max_time_steps, seeds, record_trajectories):
+    """
+    Parallel Monte Carlo driver: one prange iteration per independent
+    simulation, writing into preallocated (n_sims, T+1) output arrays.
+    Rows are padded past fill_time with the final value.
+
+    The price matrix is float32 — plotting and trajectory analysis are
+    memory-bound and don't need more; per-sim summary scalars (final
+    price, fill rate, volume) stay float64. Per-step fill percentages
+    are summarized by the fill_rates column; nothing downstream consumes
+    them as a matrix, so none is kept. With record_trajectories=False
+    the price matrix stays (n_sims, 1) and memory is O(n_sims) instead
+    of O(n_sims * T).
+    """
+    hist_len = max_time_steps + 1 if record_trajectories else 1
+    price_hist = np.empty((n_sims, hist_len), dtype=np.float32)
+    fill_times = np.empty(n_sims, dtype=np.int64)
+    volumes = np.empty(n_sims)
+    final_prices = np.empty(n_sims)
+    fill_rates = np.empty(n_sims)
+
+    for i in prange(n_sims):
+        ph, _, _, ft, tv, fp, fr = _sim_core(
+            token_reserve, quote_reserve, order_size, delta_ratio,
+            min_threshold, buy_rate, log_mean_buy, buy_sigma,
+            organic_rate, mean_organic_sell, max_time_steps, seeds[i],
+            record_trajectories
+        )
+        if record_trajectories:
+            price_hist[i, :ft + 1] = ph
+            price_hist[i, ft + 1:] = fp
+        fill_times[i] = ft
+        volumes[i] = tv
+        final_prices[i] = fp
+        fill_rates[i] = fr
+
+    return price_hist, fill_times, volumes, final_prices, fill_rates
 
 
 class ProfitMaxiSimulator:
@@ -160,14 +340,23 @@ class ProfitMaxiSimulator:
     
     def __init__(self, config: SimulationConfig):
         self.config = config
-        self.rng = np.random.default_rng()
+        # All randomness is spawned from one SeedSequence rooted at
+        # config.seed, so runs are bit-reproducible and parallel streams
+        # never share entropy; PCG64DXSM is the faster, statistically
+        # stronger bit generator for many parallel streams
+        self._seed_seq = np.random.SeedSequence(config.seed)
+        self.rng = np.random.Generator(
+            np.random.PCG64DXSM(self._seed_seq.spawn(1)[0]))
+        # Log-normal buy-size parameters, computed once for the hot paths
+        self._log_mean_buy = np.log(config.mean_buy_size)
+        self._buy_sigma = 0.8
     
     def generate_buy_volume(self) -> float:
         """Generate a single buy order size (log-normal distribution)"""
         # Log-normal better models real market buy distributions
         size = self.rng.lognormal(
-            mean=np.log(self.config.mean_buy_size),
-            sigma=0.8
+            mean=self._log_mean_buy,
+            sigma=self._buy_sigma
         )
         return max(0.01, size)  # Minimum dust amount
     
@@ -175,16 +364,56 @@ class ProfitMaxiSimulator:
         """Generate number of buys in a time step (Poisson)"""
         return self.rng.poisson(self.config.buy_arrival_rate)
     
-    def run_single_simulation(self) -> SimulationResult:
-        """Execute one complete simulation"""
-        
-        # Initialize pool
-        pool = AMMPool(
-            token_reserve=self.config.initial_token_reserve,
-            quote_reserve=self.config.initial_quote_reserve
-        )
-        initial_price = pool.price
-        
+    def run_single_simulation_detailed(self) -> SimulationResult:
+        """
+        Execute one complete simulation, keeping the full price/fill
+        histories and per-fill records. The Monte Carlo fast path is
+        run_monte_carlo, which returns arrays only.
+        """
+        if NUMBA_AVAILABLE:
+            (price_hist, fill_hist, fills, fill_time, total_volume,
+             final_price, fill_rate) = _sim_core(
+                self.config.initial_token_reserve,
+                self.config.initial_quote_reserve,
+                self.config.order_size,
+                self.config.delta_ratio,
+                self.config.min_threshold,
+                self.config.buy_arrival_rate,
+                self._log_mean_buy,
+                self._buy_sigma,
+                self.config.organic_sell_rate,
+                self.config.mean_organic_sell,
+                self.config.max_time_steps,
+                int(self.rng.integers(0, 2**31 - 1)),
+                True
+            )
+            order_fills = np.rec.fromarrays(
+                [fills[:, 0].astype(np.int32)] + [fills[:, j] for j in range(1, 6)],
+                dtype=FILL_DTYPE
+            )
+            return SimulationResult(
+                final_price=price_hist[-1],
+                initial_price=price_hist[0],
+                fill_time=fill_time,
+                total_volume=total_volume,
+                price_history=price_hist,
+                fill_history=fill_hist,
+                order_fills=order_fills,
+                price_change_pct=(price_hist[-1] / price_hist[0] - 1.0) * 100.0,
+                was_filled=fill_hist[-1] >= 99.99
+            )
+        return self._run_single_interpreted()
+
+    def _run_single_interpreted(self) -> SimulationResult:
+        """Pure NumPy fallback for the single-simulation core"""
+
+        # Reserves live in local floats for the whole loop; going through
+        # AMMPool property descriptors per access is pure interpreter
+        # overhead on this path
+        tok = float(self.config.initial_token_reserve)
+        quote = float(self.config.initial_quote_reserve)
+        initial_price = quote / tok
+
         # Initialize order
         order = ProfitMaxiOrder(
             total_size=self.config.order_size,
@@ -192,92 +421,324 @@ class ProfitMaxiSimulator:
             min_threshold=self.config.min_threshold
         )
         
-        # Tracking
-        price_history = [initial_price]
-        fill_history = [0.0]
-        total_volume = 0
-        
+        # Tracking (preallocated; steps tracks the logical length)
+        price_history = np.empty(self.config.max_time_steps + 1)
+        fill_history = np.empty(self.config.max_time_steps + 1)
+        price_history[0] = initial_price
+        fill_history[0] = 0.0
+        total_volume = 0.0
+        steps = 0
+
+        # Pre-draw all randomness for the path in a few batched RNG calls;
+        # cursors slice out each step's share
+        T = self.config.max_time_steps
+        num_buys_all = self.rng.poisson(self.config.buy_arrival_rate, T)
+        buys_all = np.maximum(
+            self.rng.lognormal(self._log_mean_buy, self._buy_sigma,
+                               num_buys_all.sum()),
+            0.01
+        )
+        cursor = 0
+        if self.config.organic_sell_rate > 0:
+            num_organic_all = self.rng.poisson(self.config.organic_sell_rate, T)
+            # Exponential sizes via inverse transform on one uniform batch
+            organic_all = -self.config.mean_organic_sell * np.log1p(
+                -self.rng.random(num_organic_all.sum()))
+            organic_cursor = 0
+
+        # Fill bookkeeping as a running cumulative-clip scan: already_filled
+        # carries across steps, so per-buy sell amounts fall out of one
+        # cumsum/minimum/diff triplet with no per-buy conditionals
+        already_filled = 0.0
+        total_size = order.total_size
+
         # Simulation loop
-        for t in range(self.config.max_time_steps):
-            if order.is_complete:
+        for t in range(T):
+            if already_filled >= total_size:
                 break
-            
-            # Generate buy orders for this time step
-            num_buys = self.generate_num_buys()
-            
-            for _ in range(num_buys):
-                buy_size = self.generate_buy_volume()
-                total_volume += buy_size
-                
-                # Execute the buy
-                tokens_bought = pool.buy_tokens(buy_size)
-                
-                # Check if triggers ProfitMaxi
-                if buy_size >= order.min_threshold and not order.is_complete:
-                    # Calculate sell amount based on delta ratio
-                    sell_quote_value = min(
-                        order.delta_ratio * buy_size,
-                        order.remaining
+
+            num_buys = num_buys_all[t]
+            buys = buys_all[cursor:cursor + num_buys]
+            cursor += num_buys
+
+            if num_buys > 0:
+                total_volume += buys.sum()
+
+                # Advance the pool along the constant-k trajectory for the
+                # whole batch of buys in a single array expression
+                k = tok * quote
+                quote_path = quote + np.cumsum(buys)
+                token_path = k / quote_path
+
+                quote = quote_path[-1]
+                tok = token_path[-1]
+
+                if already_filled < total_size:
+                    # Resolve triggers via boolean mask; the cumulative clip
+                    # guarantees total fills never exceed the order size
+                    triggered = buys >= order.min_threshold
+                    cum_clipped = np.minimum(
+                        already_filled +
+                        np.cumsum(order.delta_ratio * buys * triggered),
+                        total_size
                     )
-                    
-                    # Convert to tokens at current price
-                    tokens_to_sell = pool.quote_to_tokens(sell_quote_value)
-                    
-                    # Execute the sell
-                    quote_received = pool.sell_tokens(tokens_to_sell)
-                    
-                    # Update order
-                    order.remaining -= sell_quote_value
-                    order.fills.append({
-                        'time': t,
-                        'trigger_buy': buy_size,
-                        'sell_amount': sell_quote_value,
-                        'tokens_sold': tokens_to_sell,
-                        'quote_received': quote_received,
-                        'price_at_fill': pool.price
-                    })
+                    sell_quote_value = cum_clipped[-1] - already_filled
+
+                    if sell_quote_value > 0:
+                        per_buy_sell = np.diff(cum_clipped,
+                                               prepend=already_filled)
+                        price_path = quote_path / token_path
+                        tokens_per_buy = per_buy_sell / price_path
+
+                        # Apply the step's sells as one aggregated swap after
+                        # the buys (k is re-derived from the updated reserves)
+                        k = tok * quote
+                        tok = tok + tokens_per_buy.sum()
+                        new_quote = k / tok
+                        quote_received = quote - new_quote
+                        quote = new_quote
+
+                        # Update order
+                        already_filled = cum_clipped[-1]
+                        order.remaining = total_size - already_filled
+                        filled = per_buy_sell > 0
+                        order.record_fills(np.rec.fromarrays(
+                            [
+                                np.full(filled.sum(), t, dtype=np.int32),
+                                buys[filled],
+                                per_buy_sell[filled],
+                                tokens_per_buy[filled],
+                                quote_received * per_buy_sell[filled] / sell_quote_value,
+                                price_path[filled],
+                            ],
+                            dtype=FILL_DTYPE
+                        ))
             
-            # Optional: organic sell pressure
+            # Optional: organic sell pressure (aggregated per step)
             if self.config.organic_sell_rate > 0:
-                num_organic_sells = self.rng.poisson(self.config.organic_sell_rate)
-                for _ in range(num_organic_sells):
-                    organic_sell = self.rng.exponential(self.config.mean_organic_sell)
-                    tokens_to_sell = pool.quote_to_tokens(organic_sell)
-                    pool.sell_tokens(tokens_to_sell)
+                num_organic_sells = num_organic_all[t]
+                if num_organic_sells > 0:
+                    organic_sells = organic_all[
+                        organic_cursor:organic_cursor + num_organic_sells]
+                    organic_cursor += num_organic_sells
+                    k = tok * quote
+                    tok = tok + organic_sells.sum() * tok / quote
+                    quote = k / tok
             
-            price_history.append(pool.price)
-            fill_history.append(order.fill_percentage)
-        
+            price_history[t + 1] = quote / tok
+            fill_history[t + 1] = already_filled / total_size * 100.0
+            steps = t + 1
+
         return SimulationResult(
-            final_price=pool.price,
+            final_price=quote / tok,
             initial_price=initial_price,
-            fill_time=len(price_history) - 1,
+            fill_time=steps,
             total_volume=total_volume,
-            price_history=price_history,
-            fill_history=fill_history,
-            order_fills=order.fills
+            price_history=price_history[:steps + 1],
+            fill_history=fill_history[:steps + 1],
+            order_fills=order.fills[:order.num_fills],
+            price_change_pct=(quote / tok / initial_price - 1.0) * 100.0,
+            was_filled=fill_history[steps] >= 99.99
         )
     
-    def run_monte_carlo(self, verbose: bool = True) -> List[SimulationResult]:
-        """Run full Monte Carlo simulation"""
-        results = []
-        
-        for i in range(self.config.num_simulations):
-            result = self.run_single_simulation()
-            results.append(result)
-            
-            if verbose and (i + 1) % 100 == 0:
-                print(f"Completed {i + 1}/{self.config.num_simulations} simulations")
-        
-        return results
+    def _run_ensemble(self, rng: np.random.Generator,
+                      record_trajectories: bool = True):
+        """
+        Vectorized NumPy ensemble engine: the outermost axis is the
+        simulation index, so each time step advances all N pools with a
+        handful of broadcast array ops. The time loop stays sequential
+        (paths are state-dependent) but the per-step and per-buy work runs
+        at C level. Completed sims are frozen, so their history rows are
+        naturally padded with the final value.
+
+        Returns (price_hist, fill_times, volumes, final_prices,
+        fill_rates) with the same shapes and dtypes as _sim_core_batch;
+        price_hist is None when record_trajectories is False.
+        """
+        cfg = self.config
+        N = cfg.num_simulations
+        T = cfg.max_time_steps
+
+        quote = np.full(N, float(cfg.initial_quote_reserve))
+        token = np.full(N, float(cfg.initial_token_reserve))
+        remaining = np.full(N, float(cfg.order_size))
+        volumes = np.zeros(N)
+        fill_times = np.full(N, T, dtype=np.int64)
+
+        # The price history is for plotting/trajectory analysis only,
+        # which is memory-bound: float32 halves the bytes moved. Summary
+        # stats come from the float64 loop state below, never from this
+        # matrix — so for summary-only runs it's not allocated at all.
+        if record_trajectories:
+            price_hist = np.empty((N, T + 1), dtype=np.float32)
+            price_hist[:, 0] = quote / token
+        else:
+            price_hist = None
+
+        num_buys = rng.poisson(cfg.buy_arrival_rate, (N, T))
+        if cfg.organic_sell_rate > 0:
+            # Draw every organic sell for the whole ensemble up front:
+            # exponential sizes via inverse transform on one uniform batch,
+            # then reduce the flat stream into per-(sim, step) totals
+            flat_counts = rng.poisson(cfg.organic_sell_rate, N * T)
+            sells = -cfg.mean_organic_sell * np.log1p(
+                -rng.random(int(flat_counts.sum())))
+            offsets = np.concatenate(([0], np.cumsum(flat_counts)[:-1]))
+            organic_totals = np.add.reduceat(
+                np.concatenate((sells, [0.0])), offsets)
+            organic_totals[flat_counts == 0] = 0.0  # reduceat quirk on empty buckets
+            organic_totals = organic_totals.reshape(N, T)
+
+        steps = 0
+        for t in range(T):
+            active = remaining > 0
+            nb = num_buys[:, t] * active
+
+            max_b = int(nb.max())
+            if max_b > 0:
+                # (N, max_b) buy matrix, zero-padded past each sim's count;
+                # zero buys are no-ops in the constant-k trajectory below
+                buys = np.maximum(
+                    rng.lognormal(self._log_mean_buy, self._buy_sigma,
+                                  (N, max_b)), 0.01)
+                buys *= np.arange(max_b) < nb[:, None]
+                volumes += buys.sum(axis=1)
+
+                # Buy phase: advance every pool along its cumulative
+                # quote trajectory, keeping the per-buy path so trigger
+                # sells convert at the price each buy actually traded at
+                k = token * quote
+                quote_path = quote[:, None] + np.cumsum(buys, axis=1)
+                quote = quote_path[:, -1]
+                token = k / quote
+
+                # Trigger resolution: boolean mask + row-wise cumulative
+                # clip against the remaining order, exactly as
+                # _run_single_interpreted does per sim
+                triggered = buys >= cfg.min_threshold
+                cum_clipped = np.minimum(
+                    np.cumsum(cfg.delta_ratio * buys * triggered, axis=1),
+                    remaining[:, None]
+                )
+                sell_quote = cum_clipped[:, -1]
+                per_buy_sell = np.diff(cum_clipped, axis=1, prepend=0.0)
+                # price along the path is quote_path**2 / k
+                # (token_path = k / quote_path), so tokens per buy is
+                # per_buy_sell * k / quote_path**2
+                tokens_sold = (per_buy_sell * k[:, None]
+                               / quote_path ** 2).sum(axis=1)
+                k = token * quote
+                token = token + tokens_sold
+                quote = k / token
+                remaining = remaining - sell_quote
+
+            # Optional: organic sell pressure (aggregated per step)
+            if cfg.organic_sell_rate > 0:
+                organic = organic_totals[:, t] * active
+                k = token * quote
+                token = token + organic * token / quote
+                quote = k / token
+
+            if record_trajectories:
+                price_hist[:, t + 1] = quote / token
+            # Completion is decided on the exact float64 remaining vector
+            fill_times[active & (remaining <= 0)] = t + 1
+            steps = t + 1
+
+            # Once every order in the ensemble is filled, no further step
+            # can change anything: bail out of the worst-case T loop
+            if not remaining.any():
+                break
+
+        if record_trajectories and steps < T:
+            price_hist[:, steps + 1:] = price_hist[:, steps:steps + 1]
+
+        final_prices = quote / token
+        fill_rates = (cfg.order_size - remaining) / cfg.order_size * 100.0
+        return price_hist, fill_times, volumes, final_prices, fill_rates
+
+    def run_monte_carlo(self, verbose: bool = True,
+                        record_trajectories: bool = False) -> dict:
+        """
+        Run full Monte Carlo simulation.
+
+        With numba the whole batch runs under a prange driver across all
+        cores; otherwise the vectorized ensemble engine advances every
+        simulation simultaneously in one process (which beats spawning
+        workers at these batch sizes).
+
+        Returns a dict of per-sim arrays ('price_changes', 'fill_times',
+        'fill_rates', 'total_volumes') plus, when record_trajectories is
+        set, the (n_sims, T+1) 'price_trajectories' matrix — summary-only
+        runs keep memory at O(n_sims) instead of O(n_sims * T). No
+        per-simulation Python objects are built on this path; for one-off
+        inspection with full histories and fill records, use
+        run_single_simulation_detailed.
+        """
+        n = self.config.num_simulations
+        seed_seq = self._seed_seq.spawn(1)[0]
+
+        if NUMBA_AVAILABLE:
+            seeds = np.array(
+                [int(s.generate_state(1)[0] % (2**31 - 1))
+                 for s in seed_seq.spawn(n)],
+                dtype=np.int64
+            )
+            (price_hist, fill_times, volumes,
+             final_prices, fill_rates) = _sim_core_batch(
+                n,
+                self.config.initial_token_reserve,
+                self.config.initial_quote_reserve,
+                self.config.order_size,
+                self.config.delta_ratio,
+                self.config.min_threshold,
+                self.config.buy_arrival_rate,
+                self._log_mean_buy,
+                self._buy_sigma,
+                self.config.organic_sell_rate,
+                self.config.mean_organic_sell,
+                self.config.max_time_steps,
+                seeds,
+                record_trajectories
+            )
+        else:
+            (price_hist, fill_times, volumes,
+             final_prices, fill_rates) = self._run_ensemble(
+                np.random.Generator(np.random.PCG64DXSM(seed_seq)),
+                record_trajectories)
+
+        if verbose:
+            print(f"Completed {n}/{n} simulations")
+
+        # Everything downstream (stats, plots) works off these arrays;
+        # summary columns are float64 from the loop state, histories are
+        # the downcast matrices
+        initial_price = (self.config.initial_quote_reserve
+                         / self.config.initial_token_reserve)
+        return {
+            'price_changes': (final_prices / initial_price - 1.0) * 100.0,
+            'fill_times': fill_times,
+            'fill_rates': fill_rates,
+            'total_volumes': volumes,
+            'price_trajectories': price_hist if record_trajectories else None
+        }
     
-    def analyze_results(self, results: List[SimulationResult]) -> dict:
-        """Statistical analysis of simulation results"""
-        
-        price_changes = [r.price_change_pct for r in results]
-        fill_times = [r.fill_time for r in results]
-        fill_rates = [r.fill_history[-1] for r in results]
-        
+    def analyze_results(self, arrays: dict) -> dict:
+        """Statistical analysis of a run_monte_carlo output"""
+        price_changes = np.asarray(arrays['price_changes'], dtype=np.float64)
+        fill_times = np.asarray(arrays['fill_times'], dtype=np.float64)
+        fill_rates = np.asarray(arrays['fill_rates'], dtype=np.float64)
+
+        # Lazy import: headless Monte Carlo runs shouldn't pay scipy's
+        # startup cost at module import
+        from scipy import stats
+
+        # Single pass for mean/variance/min/max, one quantile call for
+        # median and the empirical 95% CI
+        pc = stats.describe(price_changes)
+        pc_median, pc_lo, pc_hi = np.quantile(price_changes, [0.5, 0.025, 0.975])
+        ft = stats.describe(fill_times)
+
         analysis = {
             'config': {
                 'delta_ratio': self.config.delta_ratio,
@@ -287,27 +748,33 @@ class ProfitMaxiSimulator:
                 'num_simulations': self.config.num_simulations
             },
             'price_impact': {
-                'mean_pct': np.mean(price_changes),
-                'std_pct': np.std(price_changes),
-                'median_pct': np.median(price_changes),
-                'min_pct': np.min(price_changes),
-                'max_pct': np.max(price_changes),
-                'ci_95': stats.t.interval(0.95, len(price_changes)-1, 
-                                          loc=np.mean(price_changes), 
-                                          scale=stats.sem(price_changes))
+                'mean_pct': pc.mean,
+                'std_pct': np.sqrt(pc.variance),
+                'median_pct': pc_median,
+                'min_pct': pc.minmax[0],
+                'max_pct': pc.minmax[1],
+                'ci_95': (pc_lo, pc_hi)  # Empirical, non-parametric
             },
             'fill_time': {
-                'mean': np.mean(fill_times),
-                'std': np.std(fill_times),
-                'median': np.median(fill_times),
-                'min': np.min(fill_times),
-                'max': np.max(fill_times)
+                'mean': ft.mean,
+                'std': np.sqrt(ft.variance),
+                'median': np.quantile(fill_times, 0.5),
+                'min': ft.minmax[0],
+                'max': ft.minmax[1]
             },
             'fill_rate': {
-                'mean_pct': np.mean(fill_rates),
-                'fully_filled_pct': sum(1 for r in results if r.was_filled) / len(results) * 100
+                'mean_pct': fill_rates.mean(),
+                'fully_filled_pct': (fill_rates >= 99.99).mean() * 100
             }
         }
+
+        # Pre-aggregated arrays for plotting
+        analysis['arrays'] = {
+            'price_changes': price_changes,
+            'fill_times': fill_times,
+            'fill_rates': fill_rates,
+            'price_trajectories': arrays.get('price_trajectories')
+        }
         
         return analysis
 
@@ -336,12 +803,14 @@ def compare_delta_ratios(base_config: SimulationConfig,
         )
         
         simulator = ProfitMaxiSimulator(config)
-        results = simulator.run_monte_carlo(verbose=True)
-        analysis = simulator.analyze_results(results)
-        
+        # Trajectories are needed downstream by plot_comparison
+        arrays = simulator.run_monte_carlo(verbose=True,
+                                           record_trajectories=True)
+        analysis = simulator.analyze_results(arrays)
+
         comparisons[r] = {
             'analysis': analysis,
-            'results': results
+            'arrays': arrays
         }
         
         print(f"\nResults for r = {r}:")
@@ -355,7 +824,10 @@ def compare_delta_ratios(base_config: SimulationConfig,
 
 def plot_comparison(comparisons: dict, save_path: str = None):
     """Generate visualization of delta ratio comparison"""
-    
+    # Lazy import: pyplot costs hundreds of ms and ~50 MB RSS, which
+    # headless/batch runs (and spawned workers) shouldn't pay
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     fig.suptitle('ProfitMaxi: Delta Ratio Comparison Analysis', fontsize=14, fontweight='bold')
     
@@ -365,7 +837,7 @@ def plot_comparison(comparisons: dict, save_path: str = None):
     # Plot 1: Price Impact Distribution
     ax1 = axes[0, 0]
     for i, r in enumerate(ratios):
-        price_changes = [res.price_change_pct for res in comparisons[r]['results']]
+        price_changes = comparisons[r]['analysis']['arrays']['price_changes']
         ax1.hist(price_changes, bins=50, alpha=0.6, label=f'r = {r}', color=colors[i])
     ax1.axvline(x=0, color='red', linestyle='--', alpha=0.7, label='Zero impact')
     ax1.set_xlabel('Price Change (%)')
@@ -397,7 +869,7 @@ def plot_comparison(comparisons: dict, save_path: str = None):
     
     # Plot 3: Fill Time Distribution
     ax3 = axes[1, 0]
-    fill_times_data = [[res.fill_time for res in comparisons[r]['results']] for r in ratios]
+    fill_times_data = [comparisons[r]['analysis']['arrays']['fill_times'] for r in ratios]
     bp = ax3.boxplot(fill_times_data, labels=[f'r={r}' for r in ratios], patch_artist=True)
     for patch, color in zip(bp['boxes'], colors):
         patch.set_facecolor(color)
@@ -410,14 +882,15 @@ def plot_comparison(comparisons: dict, save_path: str = None):
     # Plot 4: Sample Price Trajectory
     ax4 = axes[1, 1]
     for i, r in enumerate(ratios):
-        # Pick median-performing simulation
-        results = comparisons[r]['results']
-        price_changes = [res.price_change_pct for res in results]
-        median_idx = np.argsort(price_changes)[len(price_changes)//2]
-        sample = results[median_idx]
-        
+        # Pick median-performing simulation (argpartition: O(n) selection)
+        arrays = comparisons[r]['analysis']['arrays']
+        price_changes = arrays['price_changes']
+        mid = len(price_changes) // 2
+        median_idx = np.argpartition(price_changes, mid)[mid]
+        sample = arrays['price_trajectories'][median_idx]
+
         # Normalize to percentage change
-        normalized = [(p / sample.initial_price - 1) * 100 for p in sample.price_history]
+        normalized = (sample / sample[0] - 1) * 100
         ax4.plot(normalized, label=f'r = {r}', color=colors[i], alpha=0.8)
     
     ax4.axhline(y=0, color='red', linestyle='--', alpha=0.5)
@@ -503,7 +976,9 @@ def run_full_analysis():
     }
     
     for r in ratios_to_test:
-        results_summary['results_by_delta_ratio'][str(r)] = comparisons[r]['analysis']
+        results_summary['results_by_delta_ratio'][str(r)] = {
+            k: v for k, v in comparisons[r]['analysis'].items() if k != 'arrays'
+        }
     
     with open('/home/claude/profitmaxi/results_summary.json', 'w') as f:
         json.dump(results_summary, f, indent=2, default=str)